@@ -12,7 +12,7 @@ Architecture (v1.5):
 Main Loop:
 1. Detect files in ALL source folders
 2. Wait 10 seconds (detection delay)
-3. Rescan & verify (count must match)
+3. Rescan & verify (count, sizes and mtimes must match)
 4. Move all files to NEW session folder
 5. Wait 30 seconds (cool-down)
 6. Repeat from step 1
@@ -20,13 +20,26 @@ Main Loop:
 
 import os
 import sys
+import errno
 import shutil
 from pathlib import Path
 from datetime import datetime
 import time
 import logging
-from typing import List, Dict, Tuple
-import json
+import threading
+import signal
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+from typing import List, Dict, Tuple, Optional
+
+# Optional: filesystem event notifications (FSEvents/inotify/ReadDirectoryChangesW)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
 
 # ============================================================================
 # CONFIGURATION
@@ -48,6 +61,12 @@ CONFIG = {
     "DETECTION_DELAY_SECONDS": 10,
     "COOLDOWN_SECONDS": 30,
     
+    # Change detection: wait for filesystem events instead of polling every
+    # 5s (needs `watchdog`). Full rescan still runs at least this often, for
+    # volumes that don't deliver events (network shares).
+    "USE_FS_EVENTS": True,
+    "IDLE_RESCAN_SECONDS": 60,
+    
     # Files
     "ALLOWED_EXTENSIONS": [
         ".jpg", ".jpeg", ".png", ".raw", ".dng",
@@ -55,13 +74,19 @@ CONFIG = {
         ".avi", ".psd", ".ai"
     ],
     "SKIP_HIDDEN_FILES": True,
+    # Open/read probe per file (paranoid mode); by default a file is ready
+    # once its size/mtime are unchanged between detection and rescan
+    "CHECK_FILE_LOCKS": False,
     
     # Logging
     "LOG_FILE": "file_organizer.log",
-    "STATE_FILE": ".file_organizer_state.json",
+    "STATE_FILE": ".file_organizer_state.db",
     "SILENT_MODE": True,
 }
 
+# Hashed lookup for the per-file extension check
+_ALLOWED_EXT = frozenset(e.lower() for e in CONFIG["ALLOWED_EXTENSIONS"])
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
@@ -71,13 +96,15 @@ def setup_logging():
     log_format = '%(asctime)s - %(levelname)s - %(message)s'
     log_level = logging.INFO if CONFIG["SILENT_MODE"] else logging.DEBUG
     
+    # Console output only in verbose mode; silent mode logs to file only
+    handlers = [logging.FileHandler(CONFIG["LOG_FILE"])]
+    if not CONFIG["SILENT_MODE"]:
+        handlers.append(logging.StreamHandler())
+    
     logging.basicConfig(
         level=log_level,
         format=log_format,
-        handlers=[
-            logging.FileHandler(CONFIG["LOG_FILE"]),
-            logging.StreamHandler()
-        ]
+        handlers=handlers
     )
     return logging.getLogger(__name__)
 
@@ -88,50 +115,84 @@ logger = setup_logging()
 # ============================================================================
 
 class State:
-    """Simple state file management"""
+    """Moved-file state in SQLite (WAL mode), mirrored in memory for lookups
+
+    processed_files stays an exact set: a false positive from a
+    probabilistic filter would make is_moved() skip a new file forever.
+    """
     
     def __init__(self, state_file: str):
         self.state_file = state_file
         self.processed_files: set = set()
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        self._db = None
         self.load()
     
     def load(self):
-        """Load state from file"""
+        """Open the state database and load moved paths"""
         try:
-            if os.path.exists(self.state_file):
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    self.processed_files = set(data.get('processed_files', []))
+            self._db = sqlite3.connect(self.state_file, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS moved (path TEXT PRIMARY KEY, moved_at INTEGER)"
+            )
+            self.processed_files = {row[0] for row in self._db.execute("SELECT path FROM moved")}
         except Exception as e:
-            logger.warning(f"Could not load state: {e}")
+            logger.warning("Could not load state: %s", e)
             self.processed_files = set()
     
     def save(self):
-        """Save state to file"""
-        try:
-            with open(self.state_file, 'w') as f:
-                json.dump({
-                    'processed_files': list(self.processed_files),
-                    'last_updated': datetime.now().isoformat()
-                }, f)
-        except Exception as e:
-            logger.error(f"Could not save state: {e}")
+        """Insert all pending moves in a single transaction"""
+        with self._lock:
+            if not self._pending or self._db is None:
+                return
+            try:
+                moved_at = int(time.time())
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR IGNORE INTO moved (path, moved_at) VALUES (?, ?)",
+                        ((p, moved_at) for p in self._pending)
+                    )
+                self._pending.clear()
+            except Exception as e:
+                logger.error("Could not save state: %s", e)
     
     def mark_moved(self, file_path: str):
-        """Mark file as moved"""
-        self.processed_files.add(str(file_path))
-        self.save()
+        """Mark file as moved (in memory; persisted by save())"""
+        path = str(file_path)
+        with self._lock:
+            self.processed_files.add(path)
+            self._pending.append(path)
     
     def is_moved(self, file_path: str) -> bool:
         """Check if file already moved"""
         return str(file_path) in self.processed_files
     
     def cleanup(self):
-        """Remove files from state if they no longer exist"""
-        still_exists = {f for f in self.processed_files if os.path.exists(f)}
-        if len(still_exists) < len(self.processed_files):
-            self.processed_files = still_exists
-            self.save()
+        """Remove files from state if they no longer exist
+        
+        Lists each parent directory once instead of stat-ing every path.
+        """
+        still_exists = set()
+        for parent, paths in groupby(sorted(self.processed_files, key=os.path.dirname),
+                                     key=os.path.dirname):
+            try:
+                names = set(os.listdir(parent))
+            except OSError:
+                continue  # Parent gone: none of its files exist
+            still_exists.update(p for p in paths if os.path.basename(p) in names)
+        
+        gone = self.processed_files - still_exists
+        self.processed_files = still_exists
+        if not gone or self._db is None:
+            return
+        try:
+            with self._db:
+                self._db.executemany("DELETE FROM moved WHERE path = ?", ((p,) for p in gone))
+        except Exception as e:
+            logger.error("Could not save state: %s", e)
 
 state = State(CONFIG["STATE_FILE"])
 
@@ -153,58 +214,153 @@ def is_file_locked(file_path: Path, retries: int = 3) -> bool:
                 return True  # Cannot read = locked
     return True
 
-def get_eligible_files(source_folder: Path) -> List[Path]:
-    """Get files ready to move from one source folder"""
+# Source folder mtime (ns) taken just before its last full scan
+_dir_mtimes: Dict[str, int] = {}
+
+def get_eligible_files(source_folder: str) -> List[Tuple[Path, os.stat_result]]:
+    """Get files ready to move from one source folder, with their stat"""
     eligible = []
+    skip_hidden = CONFIG["SKIP_HIDDEN_FILES"]
+    check_locks = CONFIG["CHECK_FILE_LOCKS"]
+    # Files untouched for longer than this can't have an active writer
+    recent_cutoff = time.time() - CONFIG["DETECTION_DELAY_SECONDS"]
     
     try:
-        for item in source_folder.iterdir():
-            # Skip hidden
-            if CONFIG["SKIP_HIDDEN_FILES"] and item.name.startswith('.'):
-                continue
-            
-            # Must be file
-            if not item.is_file():
-                continue
-            
-            # Must match extension
-            if item.suffix.lower() not in CONFIG["ALLOWED_EXTENSIONS"]:
-                continue
-            
-            # Must not be already moved
-            if state.is_moved(str(item)):
-                continue
-            
-            # Must not be locked
-            if is_file_locked(item):
-                continue
-            
-            eligible.append(item)
+        # Taken before reading, so entries added mid-scan bump it
+        dir_mtime = os.stat(source_folder).st_mtime_ns
+        
+        # scandir caches the entry type from the directory read, so the
+        # filters below don't cost a stat() per entry
+        with os.scandir(source_folder) as it:
+            for entry in it:
+                name = entry.name
+                
+                # Skip hidden
+                if skip_hidden and name.startswith('.'):
+                    continue
+                
+                # Must be file
+                if not entry.is_file():
+                    continue
+                
+                # Must match extension
+                if os.path.splitext(name)[1].lower() not in _ALLOWED_EXT:
+                    continue
+                
+                # Must not be already moved
+                if state.is_moved(entry.path):
+                    continue
+                
+                item = Path(entry.path)
+                st = entry.stat()
+                
+                # Must not be locked (paranoid mode only, recently modified files)
+                if check_locks and st.st_mtime > recent_cutoff and is_file_locked(item):
+                    continue
+                
+                eligible.append((item, st))
+        
+        _dir_mtimes[source_folder] = dir_mtime
     
     except Exception as e:
-        logger.error(f"Error scanning {source_folder}: {e}")
+        logger.error("Error scanning %s: %s", source_folder, e)
     
     return eligible
 
-def scan_all_sources() -> Dict[str, List[Path]]:
-    """Scan all source folders, return files per folder"""
+def scan_all_sources(folders: Optional[List[str]] = None) -> Dict[str, List[Tuple[Path, os.stat_result]]]:
+    """Scan source folders (all by default), return files per folder"""
     result = {}
     
-    for source_folder in CONFIG["SOURCE_FOLDERS"]:
-        source_path = Path(source_folder)
-        if not source_path.exists():
-            logger.warning(f"Source folder not found: {source_folder}")
+    for source_folder in CONFIG["SOURCE_FOLDERS"] if folders is None else folders:
+        # os.scandir takes the configured string as-is; no Path needed
+        if not os.path.exists(source_folder):
+            logger.warning("Source folder not found: %s", source_folder)
             continue
         
-        files = get_eligible_files(source_path)
+        files = get_eligible_files(source_folder)
         result[source_folder] = files
     
     return result
 
-def count_total_files(files_dict: Dict[str, List[Path]]) -> int:
+def verify_scan(previous: Dict[str, List[Tuple[Path, os.stat_result]]]) -> Dict[str, List[Tuple[Path, os.stat_result]]]:
+    """Rescan the folders of a previous scan, reusing unchanged listings
+    
+    A folder whose own mtime hasn't moved had no entries added, removed or
+    renamed, so only its known files are re-stat'ed (for the size/mtime
+    stability check). Changed folders get a full scan.
+    """
+    result = {}
+    
+    for source_folder, files in previous.items():
+        try:
+            if os.stat(source_folder).st_mtime_ns == _dir_mtimes.get(source_folder):
+                result[source_folder] = [(p, os.stat(p)) for p, _ in files]
+                continue
+        except OSError:
+            pass
+        result[source_folder] = get_eligible_files(source_folder)
+    
+    return result
+
+def count_total_files(files_dict: Dict[str, List[Tuple[Path, os.stat_result]]]) -> int:
     """Count total files across all sources"""
     return sum(len(files) for files in files_dict.values())
 
+def filter_stable_files(before: Dict[str, List[Tuple[Path, os.stat_result]]],
+                        after: Dict[str, List[Tuple[Path, os.stat_result]]]) -> Dict[str, List[Tuple[Path, os.stat_result]]]:
+    """Keep files from `after` whose size and mtime match the `before` scan"""
+    seen = {
+        (str(p), st.st_size, st.st_mtime_ns)
+        for files in before.values() for p, st in files
+    }
+    return {
+        folder: [(p, st) for p, st in files if (str(p), st.st_size, st.st_mtime_ns) in seen]
+        for folder, files in after.items()
+    }
+
+# ============================================================================
+# FILESYSTEM EVENTS
+# ============================================================================
+
+_files_changed = threading.Event()
+_dirty_lock = threading.Lock()
+_dirty_folders: set = set()
+
+class SourceEventHandler(FileSystemEventHandler):
+    """Marks its source folder dirty on any change inside it"""
+    
+    def __init__(self, source_folder: str):
+        super().__init__()
+        self.source_folder = source_folder
+    
+    def on_any_event(self, event):
+        with _dirty_lock:
+            _dirty_folders.add(self.source_folder)
+            _files_changed.set()
+
+def start_watching():
+    """Watch all source folders; returns None if events are unavailable"""
+    if Observer is None or not CONFIG["USE_FS_EVENTS"]:
+        return None
+    
+    try:
+        observer = Observer()
+        for folder in CONFIG["SOURCE_FOLDERS"]:
+            observer.schedule(SourceEventHandler(folder), folder, recursive=False)
+        observer.start()
+        return observer
+    except Exception as e:
+        logger.warning("Filesystem events unavailable, polling instead: %s", e)
+        return None
+
+def take_dirty_folders() -> List[str]:
+    """Return and reset the source folders that changed since the last call"""
+    with _dirty_lock:
+        folders = [f for f in CONFIG["SOURCE_FOLDERS"] if f in _dirty_folders]
+        _dirty_folders.clear()
+        _files_changed.clear()
+    return folders
+
 # ============================================================================
 # BATCH CREATION & FILE MOVING
 # ============================================================================
@@ -219,49 +375,120 @@ def create_batch_folder() -> Path:
         batch_path.mkdir(parents=True, exist_ok=True)
         return batch_path
     except Exception as e:
-        logger.error(f"Failed to create batch folder: {e}")
+        logger.error("Failed to create batch folder: %s", e)
+        raise
+
+_claim_lock = threading.Lock()
+
+def _link_move(source: Path, dest_file: Path):
+    """Same-device move that raises FileExistsError instead of overwriting:
+    os.link fails if the target exists, where rename(2) would replace it."""
+    try:
+        os.link(source, dest_file, follow_symlinks=False)
+    except FileExistsError:
         raise
+    except OSError:
+        # No hard links on this filesystem (exFAT, some SMB shares): check, then rename
+        if os.path.lexists(dest_file):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dest_file))
+        os.rename(source, dest_file)
+        return
+    os.unlink(source)
 
-def move_file(source: Path, dest_folder: Path) -> bool:
-    """Move single file to destination"""
+def _copy_move(source: Path, dest_file: Path):
+    """Cross-device move; the target is created with O_EXCL first, so an
+    existing file raises FileExistsError instead of being overwritten."""
+    open(dest_file, 'xb').close()
     try:
-        # Handle duplicates
-        dest_file = dest_folder / source.name
-        counter = 1
-        while dest_file.exists():
-            stem = source.stem
-            suffix = source.suffix
-            dest_file = dest_folder / f"{stem}_{counter}{suffix}"
-            counter += 1
-        
-        # Move file
-        shutil.move(str(source), str(dest_file))
+        shutil.copy2(str(source), str(dest_file))
+    except BaseException:
+        try:
+            os.unlink(dest_file)
+        except OSError:
+            pass
+        raise
+    os.unlink(source)
+
+def move_file(source: Path, dest_folder: Path, claimed: Optional[set] = None,
+              same_fs: bool = False) -> bool:
+    """Move single file to destination
+    
+    `claimed` holds the casefolded destination names already taken in this
+    batch (seeded from the batch folder's listing), so collisions are
+    resolved in memory and concurrent moves never pick the same target.
+    Names are compared casefolded because APFS/HFS+/exFAT are case-
+    insensitive. The move itself never overwrites; a name found taken on disk
+    anyway moves on to the next one. `same_fs` means source and destination
+    share a device, so no data has to be copied.
+    """
+    try:
+        if claimed is None:
+            claimed = {n.casefold() for n in os.listdir(dest_folder)}
         
-        # Verify move successful
-        if source.exists():
-            logger.error(f"Move verification failed: {source.name} still exists")
-            return False
+        counter = 0
+        while True:
+            # Handle duplicates (in memory, no stat per candidate name)
+            with _claim_lock:
+                name = source.name
+                while name.casefold() in claimed:
+                    counter += 1
+                    name = f"{source.stem}_{counter}{source.suffix}"
+                claimed.add(name.casefold())
+            dest_file = dest_folder / name
+            
+            # Move file
+            try:
+                if same_fs:
+                    _link_move(source, dest_file)
+                else:
+                    _copy_move(source, dest_file)
+                    
+                    # Verify move successful
+                    if source.exists():
+                        logger.error("Move verification failed: %s still exists", source.name)
+                        return False
+                break
+            except FileExistsError:
+                continue
         
         # Mark as moved
         state.mark_moved(str(source))
         return True
     
     except Exception as e:
-        logger.error(f"Failed to move {source.name}: {e}")
+        logger.error("Failed to move %s: %s", source.name, e)
         return False
 
-def move_all_files(files_dict: Dict[str, List[Path]], batch_folder: Path) -> Tuple[int, int]:
+def move_all_files(files_dict: Dict[str, List[Tuple[Path, os.stat_result]]], batch_folder: Path) -> Tuple[int, int]:
     """Move all files to batch folder
     
     Returns: (moved_count, total_count)
     """
     total = sum(len(files) for files in files_dict.values())
     moved = 0
+    claimed = {n.casefold() for n in os.listdir(batch_folder)}
+    dest_dev = os.stat(batch_folder).st_dev
     
-    for source_folder, files in files_dict.items():
-        for file_path in files:
-            if move_file(file_path, batch_folder):
-                moved += 1
+    if total < 4:
+        # Not worth a thread pool
+        for source_folder, files in files_dict.items():
+            for file_path, st in files:
+                if move_file(file_path, batch_folder, claimed, st.st_dev == dest_dev):
+                    moved += 1
+    else:
+        # Overlap I/O across source volumes
+        with ThreadPoolExecutor(max_workers=len(files_dict) * 2) as executor:
+            futures = [
+                executor.submit(move_file, file_path, batch_folder, claimed, st.st_dev == dest_dev)
+                for files in files_dict.values()
+                for file_path, st in files
+            ]
+            for future in as_completed(futures):
+                if future.result():
+                    moved += 1
+    
+    # Persist the whole batch at once
+    state.save()
     
     return moved, total
 
@@ -269,6 +496,16 @@ def move_all_files(files_dict: Dict[str, List[Path]], batch_folder: Path) -> Tup
 # MAIN LOGIC - CLEAN STATE MACHINE
 # ============================================================================
 
+_stop_requested = threading.Event()
+
+# Log only every Nth consecutive scan that finds nothing
+IDLE_SCAN_LOG_EVERY = 12
+
+def request_stop(signum=None, frame=None):
+    """Wake main_loop from any wait and make it return (SIGTERM handler)"""
+    _stop_requested.set()
+    _files_changed.set()
+
 def main_loop():
     """
     Clean main loop - repeats until user terminates
@@ -282,57 +519,81 @@ def main_loop():
     6. Repeat
     """
     
-    while True:
+    watching = start_watching() is not None
+    folders = None  # None = all source folders
+    idle_scans = 0
+    
+    while not _stop_requested.is_set():
         try:
             # ===== STEP 1: DETECT FILES =====
-            logger.info("🔍 Scanning source folders...")
-            files_dict = scan_all_sources()
+            if idle_scans % IDLE_SCAN_LOG_EVERY == 0:
+                logger.info("🔍 Scanning source folders...")
+            files_dict = scan_all_sources(folders)
             total_files = count_total_files(files_dict)
             
             if total_files == 0:
-                # No files, wait a bit before scanning again
-                time.sleep(5)
+                idle_scans += 1
+                if watching:
+                    # Sleep until a source changes, then scan only those
+                    if _files_changed.wait(CONFIG["IDLE_RESCAN_SECONDS"]):
+                        folders = take_dirty_folders()
+                    else:
+                        folders = None
+                else:
+                    # No files, wait a bit before scanning again
+                    _stop_requested.wait(5)
                 continue
             
-            logger.info(f"🔍 DETECTED: {total_files} files")
+            idle_scans = 0
+            logger.info("🔍 DETECTED: %d files", total_files)
             
             # ===== STEP 2: WAIT (DETECTION DELAY) =====
-            logger.info(f"⏳ Waiting {CONFIG['DETECTION_DELAY_SECONDS']}s before moving...")
-            time.sleep(CONFIG["DETECTION_DELAY_SECONDS"])
+            logger.info("⏳ Waiting %ds before moving...", CONFIG['DETECTION_DELAY_SECONDS'])
+            if _stop_requested.wait(CONFIG["DETECTION_DELAY_SECONDS"]):
+                break
             
             # ===== STEP 3: RESCAN & VERIFY =====
             logger.info("🔍 Rescanning to verify file count...")
-            files_dict_rescan = scan_all_sources()
+            files_dict_rescan = verify_scan(files_dict)
             total_files_rescan = count_total_files(files_dict_rescan)
             
             if total_files_rescan != total_files:
-                logger.info(f"📍 File count changed ({total_files} → {total_files_rescan}), rescanning...")
+                logger.info("📍 File count changed (%d → %d), rescanning...", total_files, total_files_rescan)
                 continue
             
             if total_files_rescan == 0:
                 logger.warning("⚠️ No files found during rescan")
                 continue
             
-            logger.info(f"✓ File count verified: {total_files_rescan} files stable")
+            # Size/mtime must match the first scan (file no longer being written)
+            files_dict_rescan = filter_stable_files(files_dict, files_dict_rescan)
+            stable_files = count_total_files(files_dict_rescan)
+            if stable_files != total_files_rescan:
+                logger.info("📍 %d files still changing, rescanning...", total_files_rescan - stable_files)
+                continue
+            
+            logger.info("✓ File count verified: %d files stable", total_files_rescan)
             
             # ===== STEP 4: MOVE FILES =====
-            logger.info(f"📤 Creating batch folder...")
+            logger.info("📤 Creating batch folder...")
             batch_folder = create_batch_folder()
-            logger.info(f"📂 Created: {batch_folder.name}")
+            logger.info("📂 Created: %s", batch_folder.name)
             
-            logger.info(f"📤 Moving {total_files_rescan} files...")
+            logger.info("📤 Moving %d files...", total_files_rescan)
             moved_count, total_count = move_all_files(files_dict_rescan, batch_folder)
             
             if moved_count > 0:
-                logger.info(f"✓ BATCH COMPLETE: {moved_count}/{total_count} files moved")
+                logger.info("✓ BATCH COMPLETE: %d/%d files moved", moved_count, total_count)
             else:
-                logger.warning(f"⚠️ No files moved (attempted {total_count})")
+                logger.warning("⚠️ No files moved (attempted %d)", total_count)
             
             # ===== STEP 5: COOLDOWN WAIT =====
-            logger.info(f"⏳ Cooldown: waiting {CONFIG['COOLDOWN_SECONDS']}s before next scan...")
-            time.sleep(CONFIG["COOLDOWN_SECONDS"])
+            logger.info("⏳ Cooldown: waiting %ds before next scan...", CONFIG['COOLDOWN_SECONDS'])
+            if _stop_requested.wait(CONFIG["COOLDOWN_SECONDS"]):
+                break
             
             # ===== STEP 6: LOOP BACK (repeat) =====
+            folders = None
             logger.info("🔄 Ready for next batch")
             
         except KeyboardInterrupt:
@@ -341,8 +602,10 @@ def main_loop():
             sys.exit(0)
         
         except Exception as e:
-            logger.error(f"Error in main loop: {e}")
-            time.sleep(5)
+            logger.error("Error in main loop: %s", e)
+            _stop_requested.wait(5)
+    
+    logger.info("✓ Stopped")
 
 # ============================================================================
 # INITIALIZATION
@@ -355,17 +618,17 @@ def startup_checks():
     for folder in CONFIG["SOURCE_FOLDERS"]:
         path = Path(folder)
         if not path.exists():
-            logger.error(f"Source folder missing: {folder}")
+            logger.error("Source folder missing: %s", folder)
             return False
         if not path.is_dir():
-            logger.error(f"Not a directory: {folder}")
+            logger.error("Not a directory: %s", folder)
             return False
     
     # Ensure destination folder exists
     try:
         Path(CONFIG["DEST_BASE_FOLDER"]).mkdir(parents=True, exist_ok=True)
     except Exception as e:
-        logger.error(f"Cannot create destination folder: {e}")
+        logger.error("Cannot create destination folder: %s", e)
         return False
     
     # Clean up state (remove files that no longer exist)
@@ -401,9 +664,10 @@ if __name__ == "__main__":
         sys.exit(1)
     
     print_header()
+    signal.signal(signal.SIGTERM, request_stop)
     
     try:
         main_loop()
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         sys.exit(1)
@@ -6,15 +6,16 @@ from PySide6.QtWidgets import (
     QListWidget, QLineEdit, QLabel, QTextEdit, QFileDialog, QSpinBox
 )
 from PySide6.QtWidgets import QCheckBox
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QThread, Signal, QMutex, QMutexLocker, QTimer, QWaitCondition
 from organizer_core import Organizer, PhotosExporter
 
 
 LOG = logging.getLogger(__name__)
 
+LOG_FLUSH_INTERVAL_MS = 200
+
 
 class Worker(QThread):
-    log_signal = Signal(str)
     status_signal = Signal(str)
 
     def __init__(self, organizer: Organizer):
@@ -22,6 +23,33 @@ class Worker(QThread):
         self.organizer = organizer
         self._running = False
         self._paused = False
+        # Log lines are buffered here and drained by the GUI thread on a timer,
+        # instead of one cross-thread signal + repaint per line
+        self._log_buf = []
+        self._log_mutex = QMutex()
+        # Guards _running/_paused; stop/pause/resume wake any pending sleep
+        self._mutex = QMutex()
+        self._wait = QWaitCondition()
+
+    def log(self, msg: str):
+        with QMutexLocker(self._log_mutex):
+            self._log_buf.append(msg)
+
+    def take_log(self) -> list:
+        with QMutexLocker(self._log_mutex):
+            lines, self._log_buf = self._log_buf, []
+        return lines
+
+    def _sleep(self, ms: int):
+        """Sleep up to `ms`, returning early on stop/pause/resume."""
+        with QMutexLocker(self._mutex):
+            if self._running and not self._paused:
+                self._wait.wait(self._mutex, int(ms))
+
+    def _wait_while_paused(self):
+        with QMutexLocker(self._mutex):
+            while self._paused and self._running:
+                self._wait.wait(self._mutex)
 
     def run(self):
         self._running = True
@@ -31,48 +59,47 @@ class Worker(QThread):
 
         while self._running:
             if self._paused:
-                self.msleep(200)
+                self._wait_while_paused()
                 continue
 
-            self.log_signal.emit('Scanning sources...')
-            files = self.organizer.scan_all_sources()
-            total = self.organizer.count_total_files(files)
+            self.log('Scanning sources...')
+            files, total = self.organizer.scan_and_count()
             if total == 0:
-                self.msleep(1000)
+                self._sleep(1000)
                 continue
 
-            self.log_signal.emit(f'Detected {total} files, waiting {detect}s')
-            for _ in range(int(detect * 10)):
-                if not self._running or self._paused:
-                    break
-                self.msleep(100)
+            self.log(f'Detected {total} files, waiting {detect}s')
+            self._sleep(detect * 1000)
+            if not self._running or self._paused:
+                continue
 
-            files_rescan = self.organizer.scan_all_sources()
-            total_rescan = self.organizer.count_total_files(files_rescan)
-            if total_rescan != total:
-                self.log_signal.emit('File count changed, skipping this round')
+            if not self.organizer.files_unchanged(files):
+                self.log('Files changed, skipping this round')
                 continue
 
             batch = self.organizer.create_batch_folder()
-            self.log_signal.emit(f'Creating batch: {batch.name}')
-            moved, attempted = self.organizer.move_all_files(files_rescan, batch)
-            self.log_signal.emit(f'Moved {moved}/{attempted} files')
+            self.log(f'Creating batch: {batch.name}')
+            moved, attempted = self.organizer.move_all_files(files, batch)
+            self.log(f'Moved {moved}/{attempted} files')
 
-            for _ in range(int(cooldown * 10)):
-                if not self._running or self._paused:
-                    break
-                self.msleep(100)
+            self._sleep(cooldown * 1000)
 
         self.status_signal.emit('stopped')
 
     def stop(self):
-        self._running = False
+        with QMutexLocker(self._mutex):
+            self._running = False
+            self._wait.wakeAll()
 
     def pause(self):
-        self._paused = True
+        with QMutexLocker(self._mutex):
+            self._paused = True
+            self._wait.wakeAll()
 
     def resume(self):
-        self._paused = False
+        with QMutexLocker(self._mutex):
+            self._paused = False
+            self._wait.wakeAll()
 
 
 class MainWindow(QWidget):
@@ -81,10 +108,13 @@ class MainWindow(QWidget):
         self.setWindowTitle('File Organizer - GUI')
         self.organizer = Organizer(config)
         self.worker = Worker(self.organizer)
-        self.worker.log_signal.connect(self.append_log)
         self.worker.status_signal.connect(self.on_status)
         self.init_ui()
 
+        self.log_timer = QTimer(self)
+        self.log_timer.timeout.connect(self.flush_worker_log)
+        self.log_timer.start(LOG_FLUSH_INTERVAL_MS)
+
     def init_ui(self):
         layout = QVBoxLayout()
 
@@ -168,7 +198,13 @@ class MainWindow(QWidget):
     def append_log(self, text: str):
         self.log.append(text)
 
+    def flush_worker_log(self):
+        lines = self.worker.take_log()
+        if lines:
+            self.log.append('\n'.join(lines))
+
     def on_status(self, st: str):
+        self.flush_worker_log()
         self.append_log(f'Status: {st}')
 
     def add_source(self):
@@ -249,7 +285,7 @@ def main():
         'ALLOWED_EXTENSIONS': ['.jpg', '.jpeg', '.png', '.raw', '.dng', '.tiff', '.gif', '.bmp', '.mp4', '.mov', '.avi', '.psd', '.ai'],
         'RECURSIVE_SCAN': True,
         'SKIP_HIDDEN_FILES': True,
-        'STATE_FILE': '.file_organizer_state.json'
+        'STATE_FILE': '.file_organizer_state.jsonl'
     }
 
     app = QApplication(sys.argv)
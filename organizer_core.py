@@ -1,68 +1,234 @@
 import os
+import errno
+import hashlib
 import shutil
 import time
 import json
 import logging
+import queue
+import threading
 from pathlib import Path
-from datetime import datetime
 from typing import List, Dict, Tuple
-import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
-    import osxphotos
-    _osxphotos_import_error = None
-except Exception as e:
-    import logging as _logging
-    osxphotos = None
-    _osxphotos_import_error = e
-    try:
-        _logging.getLogger(__name__).exception("Failed to import osxphotos: %s", e)
-    except Exception:
-        # If logging isn't available yet, silently continue; we still want to record the error
-        pass
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
 
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
-    class PhotosPermissionError(Exception):
-        """Raised when access to the Photos library is blocked by macOS privacy settings."""
+    _loads = json.loads
 
+# Heavy directories that never hold files to organize
+DEFAULT_EXCLUDED_DIRS = ('.git', 'node_modules', '__pycache__', '.venv')
+
+# osxphotos is heavy and only needed for Photos export; imported on first use
+_SENTINEL = object()
+_osxphotos_cached = _SENTINEL
+_osxphotos_import_error = None
+
+
+def _get_osxphotos():
+    """Return the osxphotos module, importing it on first call (None if unavailable)."""
+    global _osxphotos_cached, _osxphotos_import_error
+    if _osxphotos_cached is _SENTINEL:
+        try:
+            import osxphotos as _m
+            _osxphotos_cached = _m
+        except Exception as e:
+            _osxphotos_cached = None
+            _osxphotos_import_error = e
+            logging.getLogger(__name__).exception("Failed to import osxphotos: %s", e)
+    return _osxphotos_cached
+
+
+class PhotosPermissionError(Exception):
+    """Raised when access to the Photos library is blocked by macOS privacy settings."""
+
+
+def _iter_files(root, recursive: bool, allowed_exts, skip_hidden: bool, excluded_dirs=frozenset(),
+                with_stat: bool = False):
+    """Yield paths of files under root whose extension is in allowed_exts.
+
+    With `with_stat`, yields (path, stat_result) pairs instead; the stat comes
+    from DirEntry.stat(), so matching files cost one lstat and nothing else.
+
+    Walks with os.scandir and an explicit stack (no recursion limit), deciding
+    on the DirEntry name and cached file type only, so no extra stat() calls.
+    Directory symlinks are not followed (same as Path.rglob) and unreadable or
+    vanished subdirectories are skipped. Subdirectories named in
+    `excluded_dirs`, and hidden entries when `skip_hidden` is set, are pruned
+    without being read.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            # Unreadable, or removed meanwhile by a background cleanup
+            if current is root:
+                raise
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if skip_hidden and name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and name not in excluded_dirs:
+                        stack.append(entry.path)
+                    continue
+                # A leading dot alone is not an extension, as with splitext
+                dot = name.rfind('.')
+                if dot <= 0 or name[dot:].lower() not in allowed_exts:
+                    continue
+                if entry.is_file():
+                    yield (entry.path, entry.stat(follow_symlinks=False)) if with_stat else entry.path
 
 
 class State:
+    """Set of already-moved paths, persisted as an append-only JSONL journal.
+
+    Each line is {"p": path, "t": timestamp}; marks are buffered and appended
+    on flush, so a save costs O(new marks) rather than a rewrite of the whole
+    history. compact() rewrites the journal as a single snapshot line,
+    {"processed_files": [...]}, which later marks are appended after.
+    """
+
+    # Seconds between unforced flushes while files are being marked
+    SAVE_INTERVAL = 5.0
+
     def __init__(self, state_file: str):
         self.state_file = state_file
         self.processed_files = set()
         self.logger = logging.getLogger(__name__)
+        self._pending = []
+        self._fh = None
+        self._lock = threading.Lock()
+        self._last_save_ts = time.monotonic()
         self.load()
 
     def load(self):
+        path = self.state_file
+        rewrite = False
+        if not os.path.exists(path):
+            # Pick up the history of the older whole-file .json state
+            legacy = os.path.splitext(path)[0] + '.json'
+            if legacy == path or not os.path.exists(legacy):
+                return
+            path = legacy
+            rewrite = True
         try:
-            if os.path.exists(self.state_file):
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    self.processed_files = set(data.get('processed_files', []))
+            with open(path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        # Torn final line from an interrupted append; rewrite
+                        # so new appends don't land on the same line
+                        rewrite = True
+                        continue
+                    if 'p' in record:
+                        self.processed_files.add(self._key(record['p']))
+                    else:
+                        self.processed_files.update(self._key(p) for p in record.get('processed_files', []))
         except Exception as e:
             self.logger.warning(f"Could not load state: {e}")
             self.processed_files = set()
+            return
+        if rewrite:
+            self.compact()
 
     def save(self):
+        """Append pending marks to the journal."""
+        with self._lock:
+            lines, self._pending = self._pending, []
+        if not lines:
+            return
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump({'processed_files': list(self.processed_files), 'last_updated': datetime.now().isoformat()}, f)
+            if self._fh is None:
+                self._fh = open(self.state_file, 'ab')
+            self._fh.writelines(lines)
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+            self._last_save_ts = time.monotonic()
         except Exception as e:
             self.logger.error(f"Could not save state: {e}")
+            with self._lock:
+                self._pending[:0] = lines
+
+    def flush(self, force: bool = False):
+        """Save pending changes if forced or SAVE_INTERVAL has elapsed."""
+        if self._pending and (force or time.monotonic() - self._last_save_ts > self.SAVE_INTERVAL):
+            self.save()
+
+    def compact(self):
+        """Rewrite the journal as one snapshot line, replacing it atomically."""
+        with self._lock:
+            self._pending = []
+            paths = list(self.processed_files)
+        tmp = self.state_file + '.tmp'
+        try:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            with open(tmp, 'wb') as f:
+                if orjson is not None:
+                    f.write(orjson.dumps({'processed_files': paths}, option=orjson.OPT_APPEND_NEWLINE))
+                else:
+                    # Encode the strings in one join rather than json's per-item
+                    # container walk
+                    f.write(b'{"processed_files":[')
+                    f.write(','.join(map(json.dumps, paths)).encode())
+                    f.write(b']}\n')
+            os.replace(tmp, self.state_file)
+            self._last_save_ts = time.monotonic()
+        except Exception as e:
+            self.logger.error(f"Could not compact state: {e}")
+
+    @staticmethod
+    def _key(file_path) -> str:
+        """Normalize a path once, at insertion, so lookups are plain set probes."""
+        return os.path.normcase(os.path.abspath(str(file_path)))
+
+    @staticmethod
+    def _record(key: str) -> bytes:
+        return _dumps({'p': key, 't': time.time()}) + b'\n'
 
     def mark_moved(self, file_path: str):
-        self.processed_files.add(str(file_path))
-        self.save()
+        key = self._key(file_path)
+        with self._lock:
+            self.processed_files.add(key)
+            self._pending.append(self._record(key))
+        self.flush()
+
+    def mark_moved_many(self, file_paths):
+        """Record several moved files; written on the next flush."""
+        keys = [self._key(p) for p in file_paths]
+        with self._lock:
+            self.processed_files.update(keys)
+            self._pending.extend(self._record(k) for k in keys)
 
     def is_moved(self, file_path: str) -> bool:
-        return str(file_path) in self.processed_files
+        return self._key(file_path) in self.processed_files
+
+    def is_moved_str(self, s: str) -> bool:
+        """Lookup for a path string that is already absolute (e.g. DirEntry.path
+        under an absolute scan root); skips the abspath normalization."""
+        return os.path.normcase(s) in self.processed_files
 
     def cleanup(self):
-        still_exists = {f for f in self.processed_files if os.path.exists(f)}
-        if len(still_exists) < len(self.processed_files):
-            self.processed_files = still_exists
-            self.save()
+        """Forget paths that no longer exist and compact the journal."""
+        with self._lock:
+            self.processed_files = {f for f in self.processed_files if os.path.exists(f)}
+        self.compact()
 
 
 class Organizer:
@@ -71,12 +237,50 @@ class Organizer:
     Consumer can instantiate with a config dict similar to the original.
     """
 
+    # Max scanned-but-not-yet-moved files held by export_session
+    EXPORT_QUEUE_SIZE = 1024
+
     def __init__(self, config: Dict):
         self.config = config.copy()
         self.logger = logging.getLogger(__name__)
-        self.state = State(self.config.get('STATE_FILE', '.file_organizer_state.json'))
+        self.state = State(self.config.get('STATE_FILE', '.file_organizer_state.jsonl'))
+        self._load_scan_filters()
+        # Set by startup_checks()
+        self._source_paths = None
+        self._same_dev: Dict[str, bool] = {}
+        # (SOURCE_FOLDERS, DEST_BASE_FOLDER) of the last successful startup_checks()
+        self._startup_sig = None
+        # Serializes destination-name resolution between move workers
+        self._dest_lock = threading.Lock()
+        # Runs cleanup_all_sources_async() off the worker loop, one at a time
+        self._cleanup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cleanup')
+        # source -> {path: (st_size, st_mtime_ns)} from that source's latest
+        # scan, so the detect/rescan comparison never stats a file a second
+        # time. Each scan replaces its source's entry and a move drops it, so
+        # it never holds more than the files currently waiting in the sources
+        self._stat_cache: Dict[str, Dict[str, Tuple[int, int]]] = {}
+
+    def _load_scan_filters(self):
+        """Resolve the scan filters from config, so the per-file loop never hits
+        config. Re-run by startup_checks() to pick up edits made since."""
+        self._allowed_exts = frozenset(e.lower() for e in self.config.get('ALLOWED_EXTENSIONS', []))
+        self._skip_hidden = bool(self.config.get('SKIP_HIDDEN_FILES', True))
+        self._recursive_default = bool(self.config.get('RECURSIVE_SCAN', False))
+        # EXCLUDED_DIRS: directory names never descended into by recursive
+        # scans (hidden directories are also pruned when SKIP_HIDDEN_FILES is set)
+        self._excluded_dirs = frozenset(self.config.get('EXCLUDED_DIRS', DEFAULT_EXCLUDED_DIRS))
+        self._verify_moves = bool(self.config.get('VERIFY_MOVES', False))
 
     def is_file_locked(self, file_path: Path, retries: int = 3) -> bool:
+        if hasattr(os, 'O_NONBLOCK'):
+            # POSIX: a single non-blocking open, no retry sleeps
+            try:
+                fd = os.open(file_path, os.O_RDONLY | os.O_NONBLOCK)
+            except OSError:
+                return True
+            os.close(fd)
+            return False
+
         for attempt in range(retries):
             try:
                 with open(file_path, 'rb') as f:
@@ -89,166 +293,427 @@ class Organizer:
                     return True
         return True
 
-    def get_eligible_files(self, source_folder: Path, recursive: bool = None) -> List[Path]:
+    def get_eligible_files(self, source_folder: Path, recursive: bool = None) -> List[str]:
         """
         Get eligible files in a source folder.
 
-        If `recursive` is None, the value will be read from self.config['RECURSIVE_SCAN'].
+        If `recursive` is None, the RECURSIVE_SCAN value from the config is used.
+        Returns absolute path strings; scan results stay plain str throughout.
         """
-        eligible = []
+        candidates = []
         try:
-            if recursive is None:
-                recursive = bool(self.config.get('RECURSIVE_SCAN', False))
-
-            if recursive:
-                iterator = source_folder.rglob('*')
-            else:
-                iterator = source_folder.iterdir()
-
-            for item in iterator:
-                # Must be file
-                if not item.is_file():
-                    continue
-
-                # Skip hidden
-                if self.config.get('SKIP_HIDDEN_FILES', True) and item.name.startswith('.'):
-                    continue
-
-                # Must match extension
-                if item.suffix.lower() not in self.config.get('ALLOWED_EXTENSIONS', []):
-                    continue
-
-                # Must not be already moved
-                if self.state.is_moved(str(item)):
-                    continue
-
-                # Must not be locked
-                if self.is_file_locked(item):
-                    continue
-
-                eligible.append(item)
-
+            candidates.extend(self._iter_candidates(source_folder, recursive, with_stat=True))
         except Exception as e:
             self.logger.error(f"Error scanning {source_folder}: {e}")
-        return eligible
-
-    def scan_all_sources(self) -> Dict[str, List[Path]]:
-        result = {}
-        for source_folder in self.config.get('SOURCE_FOLDERS', []):
-            source_path = Path(source_folder)
-            if not source_path.exists():
-                self.logger.warning(f"Source folder not found: {source_folder}")
-                continue
-            files = self.get_eligible_files(source_path, recursive=bool(self.config.get('RECURSIVE_SCAN', False)))
-            result[source_folder] = files
-        return result
+
+        if not candidates:
+            self._stat_cache.pop(str(source_folder), None)
+            return []
+
+        # Must not be locked: the probes are independent I/O, run them concurrently
+        with ThreadPoolExecutor(max_workers=self.config.get('SCAN_THREADS', 8)) as executor:
+            locked = list(executor.map(self.is_file_locked, [p for p, _ in candidates]))
+        # Locked candidates are recorded too: files_unchanged() must know
+        # them as already seen, not as newly arrived
+        stats = {p: (st.st_size, st.st_mtime_ns) for p, st in candidates}
+        self._stat_cache[str(source_folder)] = stats
+        return [p for (p, _), is_locked in zip(candidates, locked) if not is_locked]
+
+    def _iter_candidates(self, source_folder: Path, recursive: bool = None, with_stat: bool = False):
+        """Yield path strings (or (path, stat_result) pairs with `with_stat`)
+        under source_folder that pass the name and state filters."""
+        if recursive is None:
+            recursive = self._recursive_default
+
+        # An absolute root makes every yielded path a ready-made state key
+        is_moved = self.state.is_moved_str
+        for item in _iter_files(os.path.abspath(source_folder), recursive, self._allowed_exts,
+                                self._skip_hidden, self._excluded_dirs, with_stat):
+            # Must not be already moved
+            if not is_moved(item[0] if with_stat else item):
+                yield item
+
+    def _validated_sources(self) -> List[Path]:
+        if self._source_paths is None:
+            raise RuntimeError("startup_checks() must be called before scanning sources")
+        return self._source_paths
+
+    def scan_all_sources(self, changed=None) -> Dict[str, List[str]]:
+        """Scan every source folder, or with `changed` (paths reported by a
+        filesystem watcher) only the source folders containing one of them."""
+        sources = self._validated_sources()
+        if changed is None:
+            # A full scan starts a new cycle; also drops sources no longer configured
+            self._stat_cache = {}
+        else:
+            sources = [p for p in sources if self._contains_any(p, changed)]
+        if len(sources) < 2:
+            return {str(p): self.get_eligible_files(p) for p in sources}
+        # Walks are readdir-latency bound (scandir releases the GIL), so
+        # sources on different devices are scanned side by side
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            scanned = list(executor.map(self.get_eligible_files, sources))
+        return {str(p): files for p, files in zip(sources, scanned)}
+
+    def scan_and_count(self, changed=None) -> Tuple[Dict[str, List[str]], int]:
+        """scan_all_sources() plus the file total, in one call."""
+        files = self.scan_all_sources(changed)
+        return files, sum(map(len, files.values()))
+
+    def files_unchanged(self, files_dict: Dict[str, List[str]]) -> bool:
+        """Cheap stand-in for a second full scan: True if every scanned file
+        still has the size and mtime the scan saw, and no file the scan didn't
+        see appeared directly in a scanned source folder. Files the scan left
+        out as locked count as seen. Only the known paths are stat'ed and only
+        the source roots are listed, never the whole tree."""
+        is_moved = self.state.is_moved_str
+        for source, files in files_dict.items():
+            stats = self._stat_cache.get(source, {})
+            for f in files:
+                s = str(f)
+                try:
+                    st = os.lstat(s)
+                except OSError:
+                    return False
+                if (st.st_size, st.st_mtime_ns) != stats.get(s):
+                    return False
+            try:
+                for s in _iter_files(os.path.abspath(source), False, self._allowed_exts, self._skip_hidden):
+                    if s not in stats and not is_moved(s):
+                        return False
+            except OSError:
+                return False
+        return True
+
+    @staticmethod
+    def _contains_any(source_path: Path, paths) -> bool:
+        # Watchers report resolved paths (e.g. /private/var for /var)
+        root = os.path.join(os.path.realpath(source_path), '')
+        return any(os.path.join(p.rstrip(os.sep), '').startswith(root) for p in paths)
 
     def cleanup_empty_directories(self, source_folder_path: Path):
         """
         Recursively remove empty subdirectories within source folder.
         """
+        root = str(source_folder_path)
+
+        def _prune(dir_path: str) -> bool:
+            # One scandir pass per directory: children are pruned first, and
+            # the directory is empty if nothing survives. Returns True if removed.
+            empty = True
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not _prune(entry.path):
+                                empty = False
+                        else:
+                            empty = False
+            except OSError:
+                # Permission denied; leave it alone
+                return False
+            if not empty or dir_path == root:
+                return False
+            try:
+                os.rmdir(dir_path)
+            except OSError:
+                # Not empty or permission denied; skip
+                return False
+            self.logger.info(f"Removed empty directory: {os.path.relpath(dir_path, root)}")
+            return True
+
         try:
-            for dirpath, dirnames, filenames in os.walk(source_folder_path, topdown=False):
-                # Skip root source folder itself
-                if dirpath == str(source_folder_path):
-                    continue
-                try:
-                    if not os.listdir(dirpath):
-                        os.rmdir(dirpath)
-                        self.logger.info(f"Removed empty directory: {Path(dirpath).relative_to(source_folder_path)}")
-                except OSError:
-                    # Not empty or permission denied; skip
-                    pass
+            _prune(root)
         except Exception as e:
             self.logger.error(f"Error cleaning up directories in {source_folder_path}: {e}")
 
     def cleanup_all_sources(self):
         if not bool(self.config.get('AUTO_CLEANUP_EMPTY_DIRS', False)):
             return
-        for source_folder in self.config.get('SOURCE_FOLDERS', []):
-            source_path = Path(source_folder)
-            if source_path.exists():
-                self.cleanup_empty_directories(source_path)
+        for source_path in self._validated_sources():
+            self.cleanup_empty_directories(source_path)
+
+    def cleanup_all_sources_async(self, on_error=None):
+        """Queue cleanup_all_sources() on a background thread and return its
+        Future, so the caller's next scan needn't wait for it. Exceptions go to
+        `on_error(exc)` when given, else to the logger."""
+        def run():
+            try:
+                self.cleanup_all_sources()
+            except Exception as e:
+                if on_error is not None:
+                    on_error(e)
+                else:
+                    self.logger.error(f"Cleanup error: {e}")
+        return self._cleanup_pool.submit(run)
 
     def export_session(self) -> Tuple[int, int, Path]:
         """Export session: move all files from source subfolders to destination, then delete empty subfolders.
         
         Returns: (moved_count, total_count, batch_folder)
         """
-        # Scan all sources recursively
-        files_dict = self.scan_all_sources()
-        total = self.count_total_files(files_dict)
-        
+        # Scan and move as a pipeline: this thread walks the sources and feeds
+        # a bounded queue while MOVE_THREADS workers move files off it, so the
+        # source reads overlap the destination writes and memory stays bounded
+        work = queue.Queue(maxsize=self.EXPORT_QUEUE_SIZE)
+        reserved = set()
+        moved_paths = []
+        moved_lock = threading.Lock()
+        batch_folder = None
+        batch_prefix = None
+        workers = []
+        total = 0
+
+        def consume():
+            while True:
+                file_path = work.get()
+                if file_path is None:
+                    return
+                if self._move_one(file_path, batch_folder, reserved):
+                    with moved_lock:
+                        moved_paths.append(file_path)
+
+        try:
+            for source_path in self._validated_sources():
+                try:
+                    for s in self._iter_candidates(source_path):
+                        # Don't pick files back up if the destination is inside a source
+                        if batch_prefix is not None and s.startswith(batch_prefix):
+                            continue
+                        if self.is_file_locked(s):
+                            continue
+                        if batch_folder is None:
+                            batch_folder = self.create_batch_folder()
+                            batch_prefix = os.path.join(os.path.abspath(batch_folder), '')
+                            reserved.update(self._dest_names(batch_folder))
+                            self.logger.info(f'Export session: moving files to {batch_folder.name}')
+                            workers = [
+                                threading.Thread(target=consume, daemon=True)
+                                for _ in range(max(1, int(self.config.get('MOVE_THREADS', 4))))
+                            ]
+                            for t in workers:
+                                t.start()
+                        work.put(s)
+                        total += 1
+                except Exception as e:
+                    self.logger.error(f"Error scanning {source_path}: {e}")
+        finally:
+            for _ in workers:
+                work.put(None)
+            for t in workers:
+                t.join()
+
         if total == 0:
             self.logger.info('No files to export')
             return 0, 0, None
-        
-        # Create batch folder
-        batch_folder = self.create_batch_folder()
-        self.logger.info(f'Export session: moving {total} files to {batch_folder.name}')
-        
-        # Move all files
-        moved, attempted = self.move_all_files(files_dict, batch_folder)
-        
+
+        self.state.mark_moved_many(moved_paths)
+        self.logger.info(f'Export session: moved {len(moved_paths)}/{total} files to {batch_folder.name}')
+
         # Cleanup empty directories
         self.logger.info('Cleaning up empty directories...')
-        for source_folder in self.config.get('SOURCE_FOLDERS', []):
-            source_path = Path(source_folder)
-            if source_path.exists():
-                self.cleanup_empty_directories(source_path)
-        
-        return moved, attempted, batch_folder
+        for source_path in self._validated_sources():
+            self.cleanup_empty_directories(source_path)
+
+        self.state.flush(force=True)
+        return len(moved_paths), total, batch_folder
 
-    def count_total_files(self, files_dict: Dict[str, List[Path]]) -> int:
-        return sum(len(files) for files in files_dict.values())
+    def count_total_files(self, files_dict: Dict[str, List[str]]) -> int:
+        return sum(map(len, files_dict.values()))
 
     def create_batch_folder(self) -> Path:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         folder_name = f"{self.config.get('BATCH_FOLDER_PREFIX','Session')}_{timestamp}"
         batch_path = Path(self.config.get('DEST_BASE_FOLDER')) / folder_name
         batch_path.mkdir(parents=True, exist_ok=True)
         return batch_path
 
-    def move_file(self, source: Path, dest_folder: Path) -> bool:
+    def move_file(self, source, dest_folder, reserved: set = None, record: bool = True) -> bool:
+        """Move source into dest_folder (str or Path), picking a free name on collision.
+
+        `reserved` holds the casefolded names already present in or claimed
+        for dest_folder (see _dest_names); names are then resolved against it
+        alone, without touching the disk. Without it each candidate name is
+        stat'ed. The move itself never overwrites: if the name turns out to be
+        taken on disk anyway (e.g. by a name differing only in case on a
+        case-insensitive volume), the next collision name is tried. With
+        record=False the caller is responsible for marking the file as moved
+        in state.
+        """
+        src = os.fspath(source)
         try:
-            dest_file = dest_folder / source.name
-            counter = 1
-            while dest_file.exists():
-                stem = source.stem
-                suffix = source.suffix
-                dest_file = dest_folder / f"{stem}_{counter}{suffix}"
-                counter += 1
-            shutil.move(str(source), str(dest_file))
-            if source.exists():
-                self.logger.error(f"Move verification failed: {source.name} still exists")
-                return False
-            self.state.mark_moved(str(source))
+            dest_dir = os.fspath(dest_folder)
+            claimed = reserved if reserved is not None else set()
+            while True:
+                with self._dest_lock:
+                    dest_name = self._free_dest(src, dest_dir, claimed, reserved is None)
+                    claimed.add(dest_name.casefold())
+                dst = os.path.join(dest_dir, dest_name)
+                try:
+                    if self._is_same_dev(src):
+                        try:
+                            # Same filesystem: link + unlink, no data copied
+                            self._link_move(src, dst)
+                        except OSError as e:
+                            if e.errno != errno.EXDEV:
+                                raise
+                            # A mount point inside the source tree; copy instead
+                            self._copy_move(src, dst)
+                    else:
+                        # _copy_move raises on failure; the extra stat is opt-in
+                        self._copy_move(src, dst)
+                        if self._verify_moves and os.path.exists(src):
+                            self.logger.error(f"Move verification failed: {os.path.basename(src)} still exists")
+                            return False
+                    break
+                except FileExistsError:
+                    continue
+            if record:
+                self.state.mark_moved(src)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to move {source.name}: {e}")
+            self.logger.error(f"Failed to move {os.path.basename(src)}: {e}")
             return False
 
-    def move_all_files(self, files_dict: Dict[str, List[Path]], batch_folder: Path) -> Tuple[int, int]:
-        total = sum(len(files) for files in files_dict.values())
-        moved = 0
-        for source_folder, files in files_dict.items():
-            for file_path in files:
-                if self.move_file(file_path, batch_folder):
-                    moved += 1
-        return moved, total
+    @staticmethod
+    def _link_move(src: str, dst: str):
+        """Same-device move that raises FileExistsError instead of overwriting
+        dst: os.link fails if dst exists, where rename(2) would replace it."""
+        try:
+            os.link(src, dst, follow_symlinks=False)
+        except FileExistsError:
+            raise
+        except OSError as e:
+            if e.errno == errno.EXDEV:
+                raise
+            # No hard links on this filesystem (e.g. exFAT, some SMB shares):
+            # check, then rename. Our own moves are already serialized by name
+            if os.path.lexists(dst):
+                raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+            os.replace(src, dst)
+            return
+        os.unlink(src)
+
+    @staticmethod
+    def _copy_move(src: str, dst: str):
+        """Cross-device move of a regular file. Unlike shutil.move this skips the
+        rename attempt and directory checks that are known to fail here.
+        dst is created with O_EXCL first, so an existing file raises
+        FileExistsError instead of being overwritten."""
+        open(dst, 'xb').close()
+        try:
+            shutil.copy2(src, dst)
+        except BaseException:
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+            raise
+        os.unlink(src)
+
+    @staticmethod
+    def _free_dest(src: str, dest_dir: str, reserved: set, check_disk: bool = False) -> str:
+        """Pick a destination name: the original, else one suffixed with a hash
+        of the source path, which is unique per source. Names are compared
+        casefolded, as case-insensitive volumes (APFS, HFS+, exFAT) do.
+        Caller holds _dest_lock."""
+        def taken(name: str) -> bool:
+            if name.casefold() in reserved:
+                return True
+            return check_disk and os.path.lexists(os.path.join(dest_dir, name))
+
+        name = os.path.basename(src)
+        if not taken(name):
+            return name
+        stem, suffix = os.path.splitext(name)
+        tag = hashlib.blake2b(src.encode(), digest_size=4).hexdigest()
+        name = f"{stem}_{tag}{suffix}"
+        counter = 1
+        # Only reached if this same source path was already moved here, or the
+        # hashed name was taken on disk
+        while taken(name):
+            name = f"{stem}_{tag}_{counter}{suffix}"
+            counter += 1
+        return name
+
+    @staticmethod
+    def _dest_names(dest_folder: Path) -> set:
+        """Casefolded names already in dest_folder, read with a single scandir."""
+        with os.scandir(dest_folder) as it:
+            return {e.name.casefold() for e in it}
+
+    def _is_same_dev(self, source: str) -> bool:
+        for root, same in self._same_dev.items():
+            if source.startswith(root):
+                return same
+        return False
+
+    def _move_one(self, file_path: str, batch_folder: Path, reserved: set) -> bool:
+        return self.move_file(file_path, batch_folder, reserved, record=False)
+
+    def move_all_files(self, files_dict: Dict[str, List[str]], batch_folder: Path) -> Tuple[int, int]:
+        renames, copies = [], []
+        for files in files_dict.values():
+            for f in files:
+                (renames if self._is_same_dev(str(f)) else copies).append(f)
+        files = renames + copies
+        total = len(files)
+        reserved = self._dest_names(batch_folder)
+        workers = max(1, int(self.config.get('MOVE_THREADS', 4)))
+
+        def move(f):
+            return self._move_one(f, batch_folder, reserved)
+
+        # Moves are I/O bound, so several in flight overlap the syscall/copy waits.
+        # Renames on the destination's device get their own pool so they are
+        # not queued behind long cross-device copies
+        with ThreadPoolExecutor(max_workers=min(workers, len(renames)) or 1) as rename_pool, \
+                ThreadPoolExecutor(max_workers=min(workers, len(copies)) or 1) as copy_pool:
+            copied = copy_pool.map(move, copies)
+            results = list(rename_pool.map(move, renames)) + list(copied)
+
+        moved_paths = [str(f) for f, ok in zip(files, results) if ok]
+        if moved_paths:
+            self.state.mark_moved_many(moved_paths)
+            self.state.flush(force=True)
+        # This round's stats are spent either way; the next scan rebuilds them
+        for source in files_dict:
+            self._stat_cache.pop(source, None)
+        return len(moved_paths), total
 
     def startup_checks(self) -> bool:
+        """Validate the configured folders and prune state. The folder checks
+        run on every call; with unchanged folders, a repeat call skips the
+        device probes and the state cleanup. Only success is remembered, so
+        a failed check is retried in full."""
+        self._load_scan_filters()
+        sig = (tuple(self.config.get('SOURCE_FOLDERS', [])), self.config.get('DEST_BASE_FOLDER'))
+        source_paths = []
         for folder in self.config.get('SOURCE_FOLDERS', []):
             path = Path(folder)
-            if not path.exists() or not path.is_dir():
+            if not path.is_dir():
                 self.logger.error(f"Source folder invalid: {folder}")
                 return False
+            source_paths.append(path)
+        # Scans and cleanups iterate these validated paths without re-checking
+        self._source_paths = source_paths
+        if sig == self._startup_sig and os.path.isdir(self.config.get('DEST_BASE_FOLDER')):
+            return True
+        self._startup_sig = None
         try:
             Path(self.config.get('DEST_BASE_FOLDER')).mkdir(parents=True, exist_ok=True)
+            dest_dev = os.stat(self.config.get('DEST_BASE_FOLDER')).st_dev
         except Exception as e:
             self.logger.error(f"Cannot create destination folder: {e}")
             return False
+        # Source roots (absolute, with trailing separator) that share the
+        # destination's filesystem, where a move is a plain rename
+        self._same_dev = {
+            os.path.join(os.path.abspath(p), ''): os.stat(p).st_dev == dest_dev
+            for p in source_paths
+        }
         self.state.cleanup()
+        self._startup_sig = sig
         return True
 
 
@@ -263,22 +728,20 @@ class PhotosExporter:
     will raise an error. Users must grant Photos permissions to the app.
     """
 
-    def __init__(self, logger: logging.Logger = None):
+    def __init__(self, logger: logging.Logger = None, threads: int = 8):
         self.logger = logger or logging.getLogger(__name__)
-        if osxphotos is None:
+        self._threads = max(1, int(threads))
+        if _get_osxphotos() is None:
             self.logger.warning("osxphotos not available — Photos export disabled until installed")
-            try:
-                # If an import error was captured at module import time, log it for debugging
-                if '_osxphotos_import_error' in globals() and globals()['_osxphotos_import_error'] is not None:
-                    self.logger.error('osxphotos import error: %s', globals()['_osxphotos_import_error'])
-            except Exception:
-                pass
+            if _osxphotos_import_error is not None:
+                self.logger.error('osxphotos import error: %s', _osxphotos_import_error)
 
     def export_originals(self, dest_folder: str, uuids: List[str] = None) -> List[str]:
         """Export originals from Photos library to dest_folder.
 
         Returns list of exported file paths.
         """
+        osxphotos = _get_osxphotos()
         if osxphotos is None:
             raise RuntimeError("osxphotos is not installed. Run: pip install osxphotos")
 
@@ -346,15 +809,21 @@ class PhotosExporter:
                 use_photos_export=False,
             )
 
+            # Exports are independent and I/O bound, so run them on a thread
+            # pool. Photos sharing an original filename go to the same worker
+            # in order, so osxphotos' collision renaming never races itself.
+            groups = {}
             for photo in photos_to_export:
-                try:
-                    exporter = PhotoExporter(photo)
-                    results = exporter.export(str(export_dir), options=opts)
-                    # ExportResults.exported holds exported file paths
-                    for p in getattr(results, 'exported', []):
-                        exported.append(str(p))
-                except Exception as e:
-                    self.logger.error(f"Failed to export photo {getattr(photo, 'uuid', photo)}: {e}")
+                name = getattr(photo, 'original_filename', None) or getattr(photo, 'filename', None) or ''
+                groups.setdefault(name.lower(), []).append(photo)
+
+            with ThreadPoolExecutor(max_workers=min(self._threads, len(groups) or 1)) as executor:
+                futures = [
+                    executor.submit(self._export_group, group, export_dir, opts, PhotoExporter)
+                    for group in groups.values()
+                ]
+                for fut in as_completed(futures):
+                    exported.extend(fut.result())
 
         except Exception as e:
             # Provide specific guidance for permission errors
@@ -375,11 +844,39 @@ class PhotosExporter:
 
         return exported
 
+    def _export_group(self, photos, export_dir: Path, opts, exporter_cls) -> List[str]:
+        exported = []
+        for photo in photos:
+            try:
+                results = exporter_cls(photo).export(str(export_dir), options=opts)
+                # ExportResults.exported holds exported file paths
+                exported.extend(str(p) for p in getattr(results, 'exported', []))
+            except Exception as e:
+                self.logger.error(f"Failed to export photo {getattr(photo, 'uuid', photo)}: {e}")
+        return exported
+
+    # UUIDs per osascript call, keeps each script well under AppleScript parse limits
+    OSASCRIPT_BATCH = 500
+
+    @staticmethod
+    def _delete_script(uuids: List[str]) -> str:
+        items = ','.join('"' + u.replace('\\', '\\\\').replace('"', '\\"') + '"' for u in uuids)
+        return (
+            'tell application "Photos"\n'
+            f'repeat with uid in {{{items}}}\n'
+            '  try\n'
+            '    delete (first media item whose uuid is (contents of uid))\n'
+            '  end try\n'
+            'end repeat\n'
+            'end tell'
+        )
+
     def delete_from_photos(self, uuids: List[str]) -> bool:
         """Best-effort delete from Photos. Requires osxphotos and appropriate permissions.
 
         Returns True on success, False otherwise.
         """
+        osxphotos = _get_osxphotos()
         if osxphotos is None:
             self.logger.error("osxphotos not installed — cannot delete from Photos")
             return False
@@ -393,9 +890,11 @@ class PhotosExporter:
             else:
                 # Fallback: attempt AppleScript delete via osascript (best-effort)
                 # This is risky and may not work for all Photos versions; warn the user.
-                for uid in uuids:
-                    script = f'tell application "Photos" to delete (first media item whose uuid is "{uid}")'
-                    subprocess.run(['osascript', '-e', script], check=False)
+                import subprocess
+                # One osascript per chunk of UUIDs instead of one process each
+                uuids = list(uuids)
+                for i in range(0, len(uuids), self.OSASCRIPT_BATCH):
+                    subprocess.run(['osascript', '-e', self._delete_script(uuids[i:i + self.OSASCRIPT_BATCH])], check=False)
                 return True
 
         except Exception as e:
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Native macOS UI using PyObjC (AppKit) that wraps the Organizer core."""
+import gc
+import os
 import sys
+import time
 from datetime import datetime
 import threading
 import logging
@@ -8,25 +11,43 @@ import sys
 import traceback
 import threading as _threading
 import signal as _signal
+import queue
+import atexit
+import logging.handlers
 from pathlib import Path
 
 from AppKit import NSApplication, NSApp, NSWindow, NSButton, NSTextField, NSTextView, NSScrollView, NSMakeRect, NSOpenPanel, NSURL
-from Foundation import NSObject, NSLog
+from Foundation import NSObject, NSLog, NSOperationQueue
 
-from organizer_core import Organizer
+try:
+    import FSEvents
+    from CoreFoundation import CFRunLoopGetCurrent, kCFRunLoopDefaultMode
+except ImportError:
+    FSEvents = None
 
 # Configure logging to a file so we capture unhandled exceptions from the packaged app
 log_path = Path.home() / 'Library' / 'Logs' / 'FileOrganizer.log'
-log_path.parent.mkdir(parents=True, exist_ok=True)
-file_handler = logging.FileHandler(str(log_path), encoding='utf-8')
-file_handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
-file_handler.setFormatter(formatter)
 root_logger = logging.getLogger()
-if not root_logger.handlers:
-    logging.basicConfig(level=logging.INFO)
-root_logger.addHandler(file_handler)
-root_logger.setLevel(logging.INFO)
+# Done once per process: the flag lives on the root logger, so importing this
+# module again (reload, py2app bootstrap, __main__ plus a named import) does
+# not attach a second handler or rewrite the startup markers
+_LOG_INIT = getattr(root_logger, '_fileorganizer_log_init', False)
+if not _LOG_INIT:
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    file_handler = logging.FileHandler(str(log_path), encoding='utf-8')
+    file_handler.setLevel(logging.DEBUG)
+    formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
+    file_handler.setFormatter(formatter)
+    # Callers only enqueue the record; a listener thread does the file writes
+    _log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(_log_queue, file_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    if not root_logger.handlers:
+        logging.basicConfig(level=logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    root_logger.setLevel(logging.INFO)
+    root_logger._fileorganizer_log_init = True
 logger = logging.getLogger(__name__)
 logger.info('pyobjc_app module imported')
 
@@ -54,16 +75,11 @@ def _report_exception(exc_type, exc_value, exc_traceback):
         pass
 
 
-sys.excepthook = _report_exception
-
-# Python 3.8+ threading hook
-try:
-    def _thread_excepthook(args):
-        _report_exception(args.exc_type, args.exc_value, args.exc_traceback)
+_report_exception._fileorganizer_hook = True
 
-    _threading.excepthook = _thread_excepthook
-except Exception:
-    pass
+# Install the hooks once per process; a re-import would otherwise chain a
+# second copy (and a second NSAlert) in front of the first
+_INSTALLED = getattr(sys.excepthook, '_fileorganizer_hook', False)
 
 # Signal handlers to log termination signals
 def _signal_handler(signum, frame):
@@ -74,86 +90,229 @@ def _signal_handler(signum, frame):
     except Exception:
         pass
 
-for _sig in ('SIGTERM', 'SIGINT', 'SIGHUP'):
+
+if not _INSTALLED:
+    sys.excepthook = _report_exception
+
+    # Python 3.8+ threading hook
     try:
-        _signal.signal(getattr(_signal, _sig), _signal_handler)
+        def _thread_excepthook(args):
+            _report_exception(args.exc_type, args.exc_value, args.exc_traceback)
+
+        _threading.excepthook = _thread_excepthook
     except Exception:
         pass
 
-# Write an immediate startup marker to both the user log and /tmp to aid debugging
-try:
-    with open(str(log_path), 'a', encoding='utf-8') as _f:
-        _f.write(f"STARTUP_MARKER: {datetime.now().isoformat()}\n")
-except Exception:
-    pass
+    try:
+        _signal.signal(_signal.SIGTERM, _signal_handler)
+        _signal.signal(_signal.SIGINT, _signal_handler)
+        _signal.signal(_signal.SIGHUP, _signal_handler)
+    except Exception:
+        pass
 
-try:
-    with open('/tmp/FileOrganizer.log', 'a', encoding='utf-8') as _f:
-        _f.write(f"STARTUP_MARKER: {datetime.now().isoformat()}\n")
-except Exception:
-    pass
+# Write an immediate startup marker to the user log (and to /tmp when
+# FILEORG_DEBUG is set) to aid debugging
+if not _LOG_INIT:
+    try:
+        with open(str(log_path), 'a', encoding='utf-8') as _f:
+            _f.write(f"STARTUP_MARKER: {datetime.now().isoformat()}\n")
+    except Exception:
+        pass
+
+    if os.environ.get('FILEORG_DEBUG'):
+        try:
+            with open('/tmp/FileOrganizer.log', 'a', encoding='utf-8') as _f:
+                _f.write(f"STARTUP_MARKER: {datetime.now().isoformat()}\n")
+        except Exception:
+            pass
 
 
 class WorkerThread(threading.Thread):
-    def __init__(self, organizer: Organizer, log_cb):
+    def __init__(self, organizer: 'Organizer', log_cb, changes: queue.Queue = None):
         super().__init__(daemon=True)
         self.organizer = organizer
         self.log_cb = log_cb
+        # Paths reported by FSEvents; None means poll every cooldown instead
+        self.changes = changes
         self._running = False
         self._paused = False
+        # One reusable Event for every sleep; stop/pause/resume set it so a
+        # sleep re-checks the run state instead of running out the cooldown
+        self._wake = threading.Event()
+        # Paused workers block here until resume()/stop() notify
+        self._pause_cond = threading.Condition()
+        # The thread lives for the whole app: Start sets _go to begin a
+        # session, _idle is set while no session is running
+        self._go = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        # When the last full scan ran; bounds how long FSEvents alone is trusted
+        self._last_full_scan = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._running
+
+    def activate(self, changes: queue.Queue = None):
+        """Begin a run session, starting the thread on first use."""
+        self.changes = changes
+        with self._pause_cond:
+            self._running = True
+            self._paused = False
+        self._idle.clear()
+        self._go.set()
+        if not self.is_alive():
+            self.start()
+
+    def wait_idle(self, timeout: float) -> bool:
+        return self._idle.wait(timeout)
+
+    def _sleep(self, timeout: float):
+        """Sleep for `timeout`, ending early only if stopped or paused.
+
+        A wake-up left over from an earlier pause/resume/stop doesn't cut the
+        sleep short, so the settle delay always runs in full.
+        """
+        deadline = time.monotonic() + timeout
+        while self._running and not self._paused:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._wake.wait(remaining)
+            self._wake.clear()
+
+    def _wait_for_changes(self, timeout: float):
+        """Block until the next round should run.
+
+        Returns the changed paths reported by FSEvents, or None (scan every
+        source) when polling, when woken by pause/stop, or once
+        IDLE_RESCAN_SECONDS have passed since the last full scan. The periodic
+        full scan picks up changes that produced no event (dropped events,
+        volumes that don't report) and files left by a skipped round.
+        """
+        if self.changes is None:
+            self._sleep(timeout)
+            return None
+        rescan_at = self._last_full_scan + self.organizer.config.get('IDLE_RESCAN_SECONDS', 60)
+        while self._running and not self._paused:
+            remaining = rescan_at - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                first = self.changes.get(timeout=min(timeout, remaining))
+            except queue.Empty:
+                continue
+            if first is None:
+                # Wake-up from stop()/pause(); recheck the loop condition
+                continue
+            paths = {first}
+            while True:
+                try:
+                    p = self.changes.get_nowait()
+                except queue.Empty:
+                    # Overdue full scan covers these paths too
+                    return paths if time.monotonic() < rescan_at else None
+                if p is not None:
+                    paths.add(p)
+        return None
 
     def run(self):
-        self._running = True
+        while True:
+            self._go.wait()
+            self._go.clear()
+            try:
+                self._session()
+            except Exception as e:
+                # Keep the thread for the next Start, but end this session:
+                # otherwise `active` stays True and Start is refused
+                logger.exception('Worker session failed')
+                self.log_cb(f'Worker error: {e}')
+                with self._pause_cond:
+                    self._running = False
+            finally:
+                self._idle.set()
+            self.log_cb('Worker stopped')
+
+    def _session(self):
         cfg = self.organizer.config
         detect = cfg.get('DETECTION_DELAY_SECONDS', 10)
         cooldown = cfg.get('COOLDOWN_SECONDS', 30)
-
+        auto_cleanup = cfg.get('AUTO_CLEANUP_EMPTY_DIRS', False)
+        # Bound once; the loop body only touches locals
+        organizer = self.organizer
+        log = self.log_cb
+        scan = organizer.scan_and_count
+        unchanged = organizer.files_unchanged
+        mk_batch = organizer.create_batch_folder
+        move = organizer.move_all_files
+        cleanup = organizer.cleanup_all_sources_async
+
+        changed = None  # first round scans every source
         while self._running:
             if self._paused:
-                threading.Event().wait(0.2)
+                with self._pause_cond:
+                    while self._paused and self._running:
+                        self._pause_cond.wait()
                 continue
 
-            self.log_cb('Scanning sources...')
-            files = self.organizer.scan_all_sources()
-            total = self.organizer.count_total_files(files)
+            log('Scanning sources...')
+            if changed is None:
+                self._last_full_scan = time.monotonic()
+            files, total = scan(changed)
             if total == 0:
-                threading.Event().wait(1.0)
+                changed = self._wait_for_changes(1.0)
                 continue
 
-            self.log_cb(f'Detected {total} files, waiting {detect}s')
-            threading.Event().wait(detect)
+            # Wait and re-check before every move, FSEvents rounds included:
+            # the stream's latency timer starts at the first event, so a
+            # callback can arrive while a copy is still being written. Files
+            # still growing are left for the next round
+            log(f'Detected {total} files, waiting {detect}s')
+            self._sleep(detect)
+            if not self._running or self._paused:
+                continue
 
-            files_rescan = self.organizer.scan_all_sources()
-            total_rescan = self.organizer.count_total_files(files_rescan)
-            if total_rescan != total:
-                self.log_cb('File count changed, skipping this round')
+            if not unchanged(files):
+                log('Files changed, skipping this round')
                 continue
 
-            batch = self.organizer.create_batch_folder()
-            self.log_cb(f'Creating batch: {batch.name}')
-            moved, attempted = self.organizer.move_all_files(files_rescan, batch)
-            self.log_cb(f'Moved {moved}/{attempted} files')
+            batch = mk_batch()
+            log(f'Creating batch: {batch.name}')
+            moved, attempted = move(files, batch)
+            log(f'Moved {moved}/{attempted} files')
 
             # Perform optional cleanup of empty subdirectories if configured
-            try:
-                if self.organizer.config.get('AUTO_CLEANUP_EMPTY_DIRS', False):
-                    self.log_cb('Cleaning up empty source directories...')
-                    self.organizer.cleanup_all_sources()
-            except Exception as e:
-                self.log_cb(f'Cleanup error: {e}')
+            if auto_cleanup:
+                # Runs in the background; the next scan doesn't wait for it
+                log('Cleaning up empty source directories...')
+                cleanup(lambda e: log(f'Cleanup error: {e}'))
 
-            threading.Event().wait(cooldown)
+            # Don't hold this round's file lists through the cooldown wait
+            del files, batch, moved, attempted
+            gc.collect(0)
+            changed = self._wait_for_changes(cooldown)
 
-        self.log_cb('Worker stopped')
+    def _wake_up(self):
+        self._wake.set()
+        if self.changes is not None:
+            self.changes.put(None)
 
     def stop(self):
-        self._running = False
+        with self._pause_cond:
+            self._running = False
+            self._pause_cond.notify_all()
+        self._wake_up()
 
     def pause(self):
-        self._paused = True
+        with self._pause_cond:
+            self._paused = True
+        self._wake_up()
 
     def resume(self):
-        self._paused = False
+        with self._pause_cond:
+            self._paused = False
+            self._pause_cond.notify_all()
+        self._wake_up()
 
 
 class AppDelegate(NSObject):
@@ -168,32 +327,86 @@ class AppDelegate(NSObject):
 
     def append_log(self, msg: str):
         logger.debug(f'append_log called: {msg}')
-        # Schedule UI update on the main thread by calling `updateLog_:` there.
+        # Buffer the line and queue `flushLog_` on the main queue, unless a
+        # flush is already pending; it will pick this line up too.
         if not self.log_view:
             logger.warning('log_view not yet initialized')
             return
+        with self._log_lock:
+            self._log_buf.append(msg)
+            if self._log_scheduled:
+                return
+            self._log_scheduled = True
         try:
-            self.performSelectorOnMainThread_withObject_waitUntilDone_('updateLog:', msg, False)
+            # A block on the main operation queue skips the NSInvocation and
+            # selector lookup of performSelectorOnMainThread:
+            NSOperationQueue.mainQueue().addOperationWithBlock_(lambda: self.flushLog_(None))
         except Exception as e:
-            logger.error(f'performSelector failed: {e}')
+            logger.error(f'main queue dispatch failed: {e}')
             # Fallback: try direct insert (may fail if called off-main-thread)
             try:
-                cur = self.log_view.string() or ''
-                self.log_view.setString_(cur + msg + '\n')
+                self.flushLog_(None)
             except Exception as e2:
-                logger.error(f'direct setString failed: {e2}')
-
-    def updateLog_(self, pymsg):
-        try:
-            cur = self.log_view.string() or ''
-        except Exception:
-            cur = ''
+                logger.error(f'direct append failed: {e2}')
+
+    def _append_text(self, text: str):
+        # Append at the end of the text storage; cost is O(len(text)) rather
+        # than copying the whole log back and forth with string()/setString_
+        storage = self.log_view.textStorage()
+        storage.beginEditing()
+        storage.replaceCharactersInRange_withString_((storage.length(), 0), text)
+        storage.endEditing()
+        self.log_view.scrollRangeToVisible_((storage.length(), 0))
+
+    def flushLog_(self, _):
+        with self._log_lock:
+            lines, self._log_buf = self._log_buf, []
+            self._log_scheduled = False
+        if not lines:
+            return
         try:
-            text = f"{cur}{pymsg}\n"
-            self.log_view.setString_(text)
+            self._append_text('\n'.join(lines) + '\n')
         except Exception:
             pass
 
+    def _start_fs_events(self):
+        """Watch the source folders with FSEvents, feeding changed paths to the worker."""
+        self._stop_fs_events()
+        folders = self.organizer.config.get('SOURCE_FOLDERS', [])
+        if FSEvents is None or not folders:
+            return False
+        changes = self._changes
+
+        def callback(stream, info, num_events, paths, flags, ids):
+            for p in list(paths)[:num_events]:
+                changes.put(str(p))
+
+        stream = FSEvents.FSEventStreamCreate(
+            None, callback, None, [str(f) for f in folders],
+            FSEvents.kFSEventStreamEventIdSinceNow,
+            float(self.organizer.config.get('DETECTION_DELAY_SECONDS', 10)),
+            # No kFSEventStreamCreateFlagNoDefer: events are delivered at most
+            # once per `latency`, timed from the first event. That batches a
+            # burst of writes but does not mean the writes have finished; the
+            # worker's settle check covers that
+            FSEvents.kFSEventStreamCreateFlagFileEvents
+            | FSEvents.kFSEventStreamCreateFlagUseCFTypes,
+        )
+        if stream is None:
+            logger.warning('FSEventStreamCreate failed; falling back to polling')
+            return False
+        FSEvents.FSEventStreamScheduleWithRunLoop(stream, CFRunLoopGetCurrent(), kCFRunLoopDefaultMode)
+        FSEvents.FSEventStreamStart(stream)
+        self._fs_stream = stream
+        return True
+
+    def _stop_fs_events(self):
+        if self._fs_stream is not None:
+            FSEvents.FSEventStreamStop(self._fs_stream)
+            FSEvents.FSEventStreamInvalidate(self._fs_stream)
+            FSEvents.FSEventStreamRelease(self._fs_stream)
+            self._fs_stream = None
+
     # Actions
     def addSource_(self, sender):
         panel = NSOpenPanel.openPanel()
@@ -220,18 +433,20 @@ class AppDelegate(NSObject):
             self.dest_field.setStringValue_(path)
 
     def start_(self, sender):
-        if self.worker and self.worker.is_alive():
+        if self.worker.active:
             self.append_log('Worker already running')
             return
         if not self.organizer.startup_checks():
             self.append_log('Startup checks failed')
             return
-        self.worker = WorkerThread(self.organizer, self.append_log)
-        self.worker.start()
+        # Source folders are only known once the user starts, so the stream is
+        # (re)created here rather than at launch
+        watching = self._start_fs_events()
+        self.worker.activate(self._changes if watching else None)
         self.append_log('Worker started')
 
     def pause_(self, sender):
-        if self.worker:
+        if self.worker.active:
             if getattr(self.worker, '_paused', False):
                 self.worker.resume()
                 self.append_log('Resumed')
@@ -240,22 +455,35 @@ class AppDelegate(NSObject):
                 self.append_log('Paused')
 
     def stop_(self, sender):
-        if self.worker:
+        if self.worker.active:
+            self._stop_fs_events()
             self.worker.stop()
-            self.worker.join(timeout=2.0)
+            self.worker.wait_idle(2.0)
             self.append_log('Stopped')
 
+    def _preload_photos_exporter(self):
+        """Import osxphotos and build the exporter off the main thread, so the
+        first Export Photos click doesn't stall the UI."""
+        try:
+            import organizer_core as _oc
+            self._photos_perm_exc = getattr(_oc, 'PhotosPermissionError', Exception)
+            self._photos_exporter = _oc.PhotosExporter()
+        except Exception as e:
+            logger.warning(f'PhotosExporter preload failed: {e}')
+
     def exportPhotos_(self, sender):
+        PhotosPermissionError = self._photos_perm_exc or Exception
         try:
-            exporter = None
-            try:
-                import organizer_core as _oc
-                PhotosPermissionError = getattr(_oc, 'PhotosPermissionError', Exception)
-                PhotosExporter = getattr(_oc, 'PhotosExporter')
-                exporter = PhotosExporter()
-            except Exception as e:
-                self.append_log(f'PhotosExporter not available: {e}')
-                return
+            exporter = self._photos_exporter
+            if exporter is None:
+                # Preload hasn't finished (or failed); do it inline
+                try:
+                    import organizer_core as _oc
+                    PhotosPermissionError = getattr(_oc, 'PhotosPermissionError', Exception)
+                    exporter = _oc.PhotosExporter()
+                except Exception as e:
+                    self.append_log(f'PhotosExporter not available: {e}')
+                    return
             batch = self.organizer.create_batch_folder()
             self.append_log(f'Exporting from Photos to {batch}')
             exported = exporter.export_originals(str(batch))
@@ -282,6 +510,10 @@ class AppDelegate(NSObject):
                 self.append_log('No source folders configured')
                 return
             
+            if not self.organizer.startup_checks():
+                self.append_log('Startup checks failed')
+                return
+
             self.append_log('Export Session: scanning all source folders...')
             moved, attempted, batch_folder = self.organizer.export_session()
             
@@ -296,28 +528,40 @@ class AppDelegate(NSObject):
 
     def applicationDidFinishLaunching_(self, notification):
         logger.info('applicationDidFinishLaunching_ called')
-        # Create organizer and build UI here (on main thread after app finishes launching)
+        # Create organizer and build UI here (on main thread after app finishes launching).
+        # Imported here so the core (and anything it pulls in) loads after launch.
+        from organizer_core import Organizer
         self.organizer = Organizer({
             'SOURCE_FOLDERS': [],
             'DEST_BASE_FOLDER': str(Path.home() / 'Desktop' / 'Organized'),
             'BATCH_FOLDER_PREFIX': 'Session',
             'DETECTION_DELAY_SECONDS': 10,
             'COOLDOWN_SECONDS': 30,
-            'ALLOWED_EXTENSIONS': ['.jpg', '.jpeg', '.png', '.raw', '.dng', '.tiff', '.gif', '.bmp', '.mp4', '.mov', '.avi', '.psd', '.ai'],
+            # With FSEvents, still scan every source at least this often
+            'IDLE_RESCAN_SECONDS': 60,
+            'ALLOWED_EXTENSIONS': frozenset({'.jpg', '.jpeg', '.png', '.raw', '.dng', '.tiff', '.gif', '.bmp', '.mp4', '.mov', '.avi', '.psd', '.ai'}),
             'SKIP_HIDDEN_FILES': True,
             'RECURSIVE_SCAN': True,
-            'STATE_FILE': '.file_organizer_state.json'
+            'STATE_FILE': '.file_organizer_state.jsonl'
         })
-        self.worker = None
+        # One worker for the app's lifetime; Start/Stop begin and end sessions
+        self.worker = WorkerThread(self.organizer, self.append_log)
+        # Set here rather than in __init__, which alloc().init() doesn't run
+        self._changes = queue.Queue()
+        self._fs_stream = None
+        # Log lines waiting for the main thread; one flushLog: is queued at a time
+        self._log_buf = []
+        self._log_lock = threading.Lock()
+        self._log_scheduled = False
+        self._photos_exporter = None
+        self._photos_perm_exc = None
+        threading.Thread(target=self._preload_photos_exporter, daemon=True).start()
 
         # Build UI
         logger.info('Building UI')
-        try:
-            from AppKit import NSTitledWindowMask, NSClosableWindowMask, NSMiniaturizableWindowMask, NSResizableWindowMask
-            style_mask = NSTitledWindowMask | NSClosableWindowMask | NSMiniaturizableWindowMask | NSResizableWindowMask
-        except:
-            style_mask = 15  # fallback
-            
+        # titled | closable | miniaturizable | resizable (1 | 2 | 4 | 8)
+        style_mask = 15
+
         self.window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
             NSMakeRect(100.0, 100.0, 900.0, 600.0),
             style_mask,
@@ -1,15 +1,45 @@
+import queue
 import threading
 import time
 from organizer_core import Organizer
 
 
 class SimpleWorker(threading.Thread):
-    def __init__(self, organizer: Organizer, log_cb):
+    def __init__(self, organizer: Organizer, log_cb, changes: queue.Queue = None):
         super().__init__(daemon=True)
         self.organizer = organizer
         self.log_cb = log_cb
+        # Changed paths from a filesystem watcher; None means poll every cooldown
+        self.changes = changes
         self._running = False
         self._paused = False
+        # When the last full scan ran; see IDLE_RESCAN_SECONDS
+        self._last_full_scan = 0.0
+
+    def _wait_for_changes(self, timeout: float):
+        """Return changed paths from the watcher, or None (scan everything).
+
+        With a watcher, everything is still rescanned once IDLE_RESCAN_SECONDS
+        have passed since the last full scan, for changes that produced no event.
+        """
+        if self.changes is None:
+            time.sleep(timeout)
+            return None
+        rescan_at = self._last_full_scan + self.organizer.config.get('IDLE_RESCAN_SECONDS', 60)
+        while self._running and not self._paused:
+            remaining = rescan_at - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                paths = {self.changes.get(timeout=min(timeout, remaining))}
+            except queue.Empty:
+                continue
+            while True:
+                try:
+                    paths.add(self.changes.get_nowait())
+                except queue.Empty:
+                    return paths if time.monotonic() < rescan_at else None
+        return None
 
     def run(self):
         self._running = True
@@ -17,32 +47,32 @@ class SimpleWorker(threading.Thread):
         detect = cfg.get('DETECTION_DELAY_SECONDS', 10)
         cooldown = cfg.get('COOLDOWN_SECONDS', 30)
 
+        changed = None  # first round scans every source
         while self._running:
             if self._paused:
                 time.sleep(0.2)
                 continue
             self.log_cb('Scanning sources...')
-            files = self.organizer.scan_all_sources()
-            total = self.organizer.count_total_files(files)
+            if changed is None:
+                self._last_full_scan = time.monotonic()
+            files, total = self.organizer.scan_and_count(changed)
             if total == 0:
-                time.sleep(1.0)
+                changed = self._wait_for_changes(1.0)
                 continue
 
             self.log_cb(f'Detected {total} files, waiting {detect}s')
             time.sleep(detect)
 
-            files_rescan = self.organizer.scan_all_sources()
-            total_rescan = self.organizer.count_total_files(files_rescan)
-            if total_rescan != total:
-                self.log_cb('File count changed, skipping this round')
+            if not self.organizer.files_unchanged(files):
+                self.log_cb('Files changed, skipping this round')
                 continue
 
             batch = self.organizer.create_batch_folder()
             self.log_cb(f'Creating batch: {batch.name}')
-            moved, attempted = self.organizer.move_all_files(files_rescan, batch)
+            moved, attempted = self.organizer.move_all_files(files, batch)
             self.log_cb(f'Moved {moved}/{attempted} files')
 
-            time.sleep(cooldown)
+            changed = self._wait_for_changes(cooldown)
 
         self.log_cb('Worker stopped')
 
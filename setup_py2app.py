@@ -11,7 +11,9 @@ OPTIONS = {
         'IPython', 'ipykernel', 'jupyter', 'numpy', 'pandas', 'matplotlib', 'cryptography', 'sphinx',
         'tornado', 'win32com', 'pygments', 'pkg_resources', 'setuptools', 'scipy', 'torch', 'tensorflow'
     ],
-    # Ensure core packages are included
+    # Ensure core packages are included. osxphotos must stay a package, copied
+    # as a directory: it loads data files (templates, grammar) by path, which
+    # a zipped site-packages would drop
     'packages': ['organizer_core', 'osxphotos'],
     # Use a generated app.icns in project root. build_app.sh will convert .ico -> .icns if needed.
     'iconfile': 'app.icns',
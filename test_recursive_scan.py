@@ -24,21 +24,22 @@ config = {
     'DEST_BASE_FOLDER': str(dest_base),
     'ALLOWED_EXTENSIONS': ['.jpg', '.jpeg'],
     'RECURSIVE_SCAN': True,
-    'STATE_FILE': str(root / 'state.json')
+    'STATE_FILE': str(root / 'state.jsonl')
 }
 
 print('Source structure:')
-for p in src.rglob('*'):
-    print(' -', p)
+for dirpath, _, names in os.walk(src):
+    for name in names:
+        print(' -', os.path.join(dirpath, name))
 
 org = Organizer(config)
 if not org.startup_checks():
     print('Startup checks failed')
     raise SystemExit(1)
 
-files = org.scan_all_sources()
-print('Scanned files dict:', {k: [str(x) for x in v] for k, v in files.items()})
-print('Total files:', org.count_total_files(files))
+files, total = org.scan_and_count()
+print('Scanned files dict:', files)
+print('Total files:', total)
 
 batch = org.create_batch_folder()
 print('Batch folder:', batch)
@@ -47,8 +48,9 @@ moved, attempted = org.move_all_files(files, batch)
 print('Moved, Attempted:', moved, attempted)
 
 print('Destination contents:')
-for p in batch.rglob('*'):
-    print(' -', p)
+for dirpath, _, names in os.walk(batch):
+    for name in names:
+        print(' -', os.path.join(dirpath, name))
 
 # cleanup
 shutil.rmtree(root)
@@ -5,9 +5,9 @@ Tkinter-based modern UI for File Organizer
 - Provides Start / Pause / Stop, Add Source, Choose Dest, Export from Photos
 - Logs actions to a scrolled text area using a thread-safe queue
 """
+import os
 import threading
 import queue
-import time
 import logging
 from pathlib import Path
 import tkinter as tk
@@ -17,72 +17,97 @@ from tkinter.scrolledtext import ScrolledText
 from organizer_core import Organizer
 
 LOG_POLL_INTERVAL_MS = 200
+# Oldest log lines are dropped beyond this, so a long-running session
+# doesn't grow the Text widget without bound
+LOG_MAX_LINES = 2000
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
+class WakeQueue(queue.Queue):
+    """Queue that also writes a byte to `wake_fd` on every put, so the Tk
+    event loop can watch the pipe instead of polling the queue."""
+
+    def __init__(self, wake_fd: int):
+        super().__init__()
+        self._wake_fd = wake_fd
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        try:
+            os.write(self._wake_fd, b'x')
+        except BlockingIOError:
+            # Pipe full: a wakeup is already pending
+            pass
+
+
 class Worker(threading.Thread):
     def __init__(self, organizer: Organizer, log_q: queue.Queue):
         super().__init__(daemon=True)
         self.organizer = organizer
         self.log_q = log_q
-        self._running = threading.Event()
-        self._paused = threading.Event()
-        self._running.clear()
-        self._paused.clear()
+        self._stop_evt = threading.Event()
+        # Set while running, cleared while paused; the loop blocks on it
+        self._resume_evt = threading.Event()
+        self._resume_evt.set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._resume_evt.is_set()
 
     def run(self):
-        self._running.set()
         cfg = self.organizer.config
         detect = cfg.get('DETECTION_DELAY_SECONDS', 10)
         cooldown = cfg.get('COOLDOWN_SECONDS', 30)
+        stop_evt = self._stop_evt
 
-        while self._running.is_set():
-            if self._paused.is_set():
-                time.sleep(0.2)
-                continue
+        # Every wait is on stop_evt, so Stop interrupts it immediately
+        while not stop_evt.is_set():
+            self._resume_evt.wait()
+            if stop_evt.is_set():
+                break
 
             self.log_q.put('Scanning sources...')
-            files = self.organizer.scan_all_sources()
-            total = self.organizer.count_total_files(files)
+            files, total = self.organizer.scan_and_count()
             if total == 0:
-                time.sleep(1.0)
+                if stop_evt.wait(1.0):
+                    break
                 continue
 
             self.log_q.put(f'Detected {total} files, waiting {detect}s')
-            time.sleep(detect)
+            if stop_evt.wait(detect):
+                break
 
-            files_rescan = self.organizer.scan_all_sources()
-            total_rescan = self.organizer.count_total_files(files_rescan)
-            if total_rescan != total:
-                self.log_q.put('File count changed, skipping this round')
+            if not self.organizer.files_unchanged(files):
+                self.log_q.put('Files changed, skipping this round')
                 continue
 
             batch = self.organizer.create_batch_folder()
             self.log_q.put(f'Creating batch: {batch.name}')
-            moved, attempted = self.organizer.move_all_files(files_rescan, batch)
+            moved, attempted = self.organizer.move_all_files(files, batch)
             self.log_q.put(f'Moved {moved}/{attempted} files')
 
             if self.organizer.config.get('AUTO_CLEANUP_EMPTY_DIRS', False):
                 self.log_q.put('Cleaning up empty source directories...')
-                try:
-                    self.organizer.cleanup_all_sources()
-                except Exception as e:
-                    self.log_q.put(f'Cleanup error: {e}')
+                self.organizer.cleanup_all_sources_async(
+                    lambda e: self.log_q.put(f'Cleanup error: {e}'))
 
-            time.sleep(cooldown)
+            if stop_evt.wait(cooldown):
+                break
 
         self.log_q.put('Worker stopped')
 
     def stop(self, timeout: float = 2.0):
-        self._running.clear()
+        self._stop_evt.set()
+        # Release a paused worker so it can see the stop
+        self._resume_evt.set()
 
     def pause(self):
-        self._paused.set()
+        self._resume_evt.clear()
 
     def resume(self):
-        self._paused.clear()
+        self._resume_evt.set()
 
 
 class App(ttk.Frame):
@@ -103,8 +128,17 @@ class App(ttk.Frame):
         style.configure('TLabel', font=('Segoe UI', 11))
         style.configure('TEntry', font=('Segoe UI', 10))
 
-        # Internal state
-        self.log_q = queue.Queue()
+        # Internal state. Where Tk can watch file descriptors (POSIX), the
+        # log is drained only when the worker writes to the wake pipe;
+        # elsewhere it falls back to polling every LOG_POLL_INTERVAL_MS
+        self._wake_r = None
+        if hasattr(self.root.tk, 'createfilehandler'):
+            self._wake_r, wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+            os.set_blocking(wake_w, False)
+            self.log_q = WakeQueue(wake_w)
+        else:
+            self.log_q = queue.Queue()
         self.worker = None
 
         # Default organizer config
@@ -119,13 +153,15 @@ class App(ttk.Frame):
             'SKIP_HIDDEN_FILES': True,
             'RECURSIVE_SCAN': True,
             'AUTO_CLEANUP_EMPTY_DIRS': True,
-            'STATE_FILE': '.file_organizer_state.json'
+            'STATE_FILE': '.file_organizer_state.jsonl'
         })
 
         self._build_ui()
 
-        # Start polling log queue
-        self.root.after(LOG_POLL_INTERVAL_MS, self._poll_log)
+        if self._wake_r is not None:
+            self.root.tk.createfilehandler(self._wake_r, tk.READABLE, self._on_log_ready)
+        else:
+            self.root.after(LOG_POLL_INTERVAL_MS, self._poll_log)
 
     def _build_ui(self):
         pad = 8
@@ -193,7 +229,7 @@ class App(ttk.Frame):
         if not self.worker:
             self._log('Worker not running')
             return
-        if getattr(self.worker, '_paused', None) and self.worker._paused.is_set():
+        if self.worker.paused:
             self.worker.resume()
             self._log('Resumed')
         else:
@@ -217,8 +253,7 @@ class App(ttk.Frame):
                 messagebox.showerror('Export Failed', 'Startup checks failed. Verify folders and retry.')
                 return
 
-            files = self.organizer.scan_all_sources()
-            total = self.organizer.count_total_files(files)
+            files, total = self.organizer.scan_and_count()
             if total == 0:
                 self._log('No files to export')
                 messagebox.showinfo('Export', 'No files found in configured source folders.')
@@ -245,19 +280,38 @@ class App(ttk.Frame):
     def _log(self, msg: str):
         self.log_q.put(msg)
 
-    def _poll_log(self):
+    def _drain_log(self):
+        # Everything queued since the last drain goes into one widget update
+        msgs = []
         try:
             while True:
-                msg = self.log_q.get_nowait()
-                self._append_log(msg)
+                msgs.append(self.log_q.get_nowait())
         except queue.Empty:
             pass
+        if msgs:
+            self._append_log('\n'.join(msgs))
+
+    def _on_log_ready(self, fd, mask):
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._drain_log()
+
+    def _poll_log(self):
+        try:
+            self._drain_log()
         finally:
             self.root.after(LOG_POLL_INTERVAL_MS, self._poll_log)
 
     def _append_log(self, msg: str):
         self.log_view.configure(state='normal')
         self.log_view.insert('end', msg + '\n')
+        # 'end-1c' sits on the empty line after the trailing newline
+        excess = int(self.log_view.index('end-1c').split('.')[0]) - 1 - LOG_MAX_LINES
+        if excess > 0:
+            self.log_view.delete('1.0', f'{excess + 1}.0')
         self.log_view.see('end')
         self.log_view.configure(state='disabled')
 